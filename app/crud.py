@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from ms_core import CRUD
-from tortoise.exceptions import DoesNotExist
+from tortoise import timezone
+from tortoise.expressions import Case, F, Q, When
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
 
 from app.deps import CurrentUser
 from app.scopes import VenueScope
 
 from .models import Venue, VenueImage, VenueUnavailability
 from .schemas import (
+    VENUE_LIST_ADAPTER,
     VenueCreate,
     VenueFilters,
     VenueImageCreate,
@@ -19,65 +25,136 @@ from .schemas import (
     VenueImageUpdate,
     VenueListItem,
     VenueResponse,
-    VenueStatus,
     VenueStatusUpdate,
     VenueUnavailabilityCreate,
     VenueUnavailabilityResponse,
     VenueUnavailabilityUpdate,
     VenueUpdate,
+    decode_cursor,
+)
+
+# Columns backing VenueListItem — the heavy text/JSON columns stay in the DB.
+_LIST_ITEM_FIELDS = (
+    "id",
+    "name",
+    "city",
+    "sport_types",
+    "status",
+    "price_per_hour",
+    "currency",
+    "capacity",
+    "is_indoor",
+    "rating",
+    "total_reviews",
+    "created_at",
+)
+
+# VenueResponse fields backed by Venue columns (everything but the relations).
+_VENUE_COLUMN_FIELDS = tuple(
+    name
+    for name in VenueResponse.model_fields
+    if name not in ("images", "unavailabilities")
 )
 
 
+async def _list_items(qs: QuerySet[Venue]) -> list[VenueListItem]:
+    """Project `qs` onto VenueListItem: list columns plus the thumbnail URL."""
+    rows = await qs.values(*_LIST_ITEM_FIELDS)
+    thumbnails: dict[UUID, str] = {}
+    if rows:
+        thumbs = VenueImage.filter(
+            venue_id__in=[row["id"] for row in rows], is_thumbnail=True
+        ).values_list("venue_id", "url")
+        for venue_id, url in await thumbs:
+            thumbnails.setdefault(venue_id, url)
+    for row in rows:
+        row["thumbnail"] = thumbnails.get(row["id"])
+    return VENUE_LIST_ADAPTER.validate_python(rows)
+
+
+async def _venue_response(venue_id: UUID, **filters: Any) -> VenueResponse | None:
+    """Read a venue row and both relations concurrently, then build the schema."""
+    row, images, unavailabilities = await asyncio.gather(
+        Venue.filter(id=venue_id, **filters).first().values(*_VENUE_COLUMN_FIELDS),
+        venue_image_crud.list_for_venue(venue_id),
+        venue_unavailability_crud.list_for_venue(venue_id),
+    )
+    if not row:
+        return None
+    return VenueResponse.from_row(row, images, unavailabilities)
+
+
 class VenueImageCRUD(CRUD[VenueImage, VenueImageResponse]):  # type: ignore
     async def create_for_venue(
         self, venue_id: UUID, payload: VenueImageCreate
     ) -> VenueImageResponse:
-        # If this is marked as thumbnail, demote any existing thumbnails first.
-        if payload.is_thumbnail:
-            await VenueImage.filter(venue_id=venue_id, is_thumbnail=True).update(
-                is_thumbnail=False
-            )
-
-        inst = await VenueImage.create(
-            venue_id=venue_id,
-            **payload.model_dump(),
-        )
+        if not payload.is_thumbnail:
+            inst = await VenueImage.create(venue_id=venue_id, **payload.model_dump())
+        else:
+            # Demote any existing thumbnail and insert the new one atomically.
+            async with in_transaction() as conn:
+                await (
+                    VenueImage.filter(venue_id=venue_id, is_thumbnail=True)
+                    .using_db(conn)
+                    .update(is_thumbnail=False)
+                )
+                inst = await VenueImage.create(
+                    venue_id=venue_id, using_db=conn, **payload.model_dump()
+                )
         return VenueImageResponse.model_validate(inst, from_attributes=True)
 
     async def update(
         self, image_id: UUID, venue_id: UUID, payload: VenueImageUpdate
     ) -> VenueImageResponse | None:
-        inst = await VenueImage.get_or_none(id=image_id, venue_id=venue_id)
-        if not inst:
-            return None
-
+        qs = VenueImage.filter(id=image_id, venue_id=venue_id)
         updates = payload.model_dump(exclude_none=True)
 
+        # UPDATE only the changed columns; a zero rowcount means no such image.
+        # Promoting a thumbnail demotes the previous one in the same transaction.
         if updates.get("is_thumbnail"):
-            await VenueImage.filter(venue_id=venue_id, is_thumbnail=True).update(
-                is_thumbnail=False
-            )
+            async with in_transaction() as conn:
+                if not await qs.using_db(conn).update(**updates):
+                    return None
+                await (
+                    VenueImage.filter(venue_id=venue_id, is_thumbnail=True)
+                    .exclude(id=image_id)
+                    .using_db(conn)
+                    .update(is_thumbnail=False)
+                )
+        elif updates and not await qs.update(**updates):
+            return None
 
-        await inst.update_from_dict(updates).save()
+        inst = await qs.first()
+        if not inst:
+            return None
         return VenueImageResponse.model_validate(inst, from_attributes=True)
 
     async def delete(self, image_id: UUID, venue_id: UUID) -> bool:
         return await self.delete_by(id=image_id, venue_id=venue_id)
 
     async def list_for_venue(self, venue_id: UUID) -> list[VenueImageResponse]:
-        images = await VenueImage.filter(venue_id=venue_id).order_by("order")
-        return [
-            VenueImageResponse.model_validate(img, from_attributes=True)
-            for img in images
-        ]
+        rows = await (
+            VenueImage.filter(venue_id=venue_id)
+            .order_by("order")
+            .values(*VenueImageResponse.model_fields)
+        )
+        # Trusted DB rows with plain column types — no validation needed.
+        return [VenueImageResponse.model_construct(**row) for row in rows]
 
     async def reorder(
         self, venue_id: UUID, ordered_ids: list[UUID]
     ) -> list[VenueImageResponse]:
         """Accept an ordered list of image IDs and persist their positions."""
-        for position, image_id in enumerate(ordered_ids):
-            await VenueImage.filter(id=image_id, venue_id=venue_id).update(
-                order=position
+        if ordered_ids:
+            # One UPDATE ... SET "order" = CASE id WHEN ... END for the whole list.
+            await VenueImage.filter(venue_id=venue_id, id__in=ordered_ids).update(
+                order=Case(
+                    *(
+                        When(id=image_id, then=position)
+                        for position, image_id in enumerate(ordered_ids)
+                    ),
+                    default=F("order"),
+                )
             )
         return await self.list_for_venue(venue_id)
 
@@ -98,26 +175,28 @@ class VenueUnavailabilityCRUD(CRUD[VenueUnavailability, VenueUnavailabilityRespo
         venue_id: UUID,
         payload: VenueUnavailabilityUpdate,
     ) -> VenueUnavailabilityResponse | None:
-        inst = await VenueUnavailability.get_or_none(
-            id=unavailability_id, venue_id=venue_id
-        )
-        if not inst:
+        qs = VenueUnavailability.filter(id=unavailability_id, venue_id=venue_id)
+        updates = payload.model_dump(exclude_none=True)
+
+        if updates and not await qs.update(**updates):
             return None
 
-        await inst.update_from_dict(payload.model_dump(exclude_none=True)).save()
+        inst = await qs.first()
+        if not inst:
+            return None
         return VenueUnavailabilityResponse.model_validate(inst, from_attributes=True)
 
     async def delete(self, unavailability_id: UUID, venue_id: UUID) -> bool:
         return await self.delete_by(id=unavailability_id, venue_id=venue_id)
 
     async def list_for_venue(self, venue_id: UUID) -> list[VenueUnavailabilityResponse]:
-        items = await VenueUnavailability.filter(venue_id=venue_id).order_by(
-            "start_datetime"
+        rows = await (
+            VenueUnavailability.filter(venue_id=venue_id)
+            .order_by("start_datetime")
+            .values(*VenueUnavailabilityResponse.model_fields)
         )
-        return [
-            VenueUnavailabilityResponse.model_validate(item, from_attributes=True)
-            for item in items
-        ]
+        # end_after_start held when the row was written — skip re-checking it.
+        return [VenueUnavailabilityResponse.model_construct(**row) for row in rows]
 
 
 class VenueCRUD(CRUD[Venue, VenueResponse]):  # type: ignore
@@ -126,32 +205,41 @@ class VenueCRUD(CRUD[Venue, VenueResponse]):  # type: ignore
             owner_id=owner_id,
             **payload.model_dump(),
         )
-        await inst.fetch_related("images", "unavailabilities")
-        return VenueResponse.model_validate(inst, from_attributes=True)
+        # A brand-new venue has no images or unavailabilities — nothing to fetch.
+        return VenueResponse.model_validate(
+            {field: getattr(inst, field) for field in _VENUE_COLUMN_FIELDS}
+        )
 
     async def update_venue(
         self, venue_id: UUID, payload: VenueUpdate, owner_id: UUID
     ) -> VenueResponse | None:
-        inst = await Venue.get_or_none(id=venue_id, owner_id=owner_id)
-        if not inst:
-            return None
+        return await self._update_venue(venue_id, payload, owner_id=owner_id)
+
+    async def admin_update_venue(
+        self, venue_id: UUID, payload: VenueUpdate
+    ) -> VenueResponse | None:
+        """Admin-only — no ownership check."""
+        return await self._update_venue(venue_id, payload)
 
-        await inst.update_from_dict(payload.model_dump(exclude_none=True)).save()
-        await inst.fetch_related("images", "unavailabilities")
-        return VenueResponse.model_validate(inst, from_attributes=True)
+    async def _update_venue(
+        self, venue_id: UUID, payload: VenueUpdate, **filters: Any
+    ) -> VenueResponse | None:
+        # queryset.update() bypasses auto_now, so stamp updated_at explicitly.
+        updates = payload.model_dump(exclude_none=True)
+        updates["updated_at"] = timezone.now()
+        if not await Venue.filter(id=venue_id, **filters).update(**updates):
+            return None
+        return await _venue_response(venue_id)
 
     async def update_status(
         self, venue_id: UUID, payload: VenueStatusUpdate
     ) -> VenueResponse | None:
         """Admin-only — no ownership check."""
-        inst = await Venue.get_or_none(id=venue_id)
-        if not inst:
+        # Single-column UPDATE; a zero rowcount means no such venue.
+        if not await Venue.filter(id=venue_id).update(status=payload.status):
             return None
 
-        inst.status = payload.status  # type: ignore
-        await inst.save(update_fields=["status"])
-        await inst.fetch_related("images", "unavailabilities")
-        return VenueResponse.model_validate(inst, from_attributes=True)
+        return await _venue_response(venue_id)
 
     async def delete_venue(self, venue_id: UUID, owner_id: UUID) -> bool:
         """Owners can only delete their own venues."""
@@ -161,51 +249,15 @@ class VenueCRUD(CRUD[Venue, VenueResponse]):  # type: ignore
         return await self.delete_by(id=venue_id)
 
     async def get_venue(self, venue_id: UUID) -> VenueResponse | None:
-        inst = await Venue.get_or_none(id=venue_id).prefetch_related(
-            "images", "unavailabilities"
-        )
-
-        if not inst:
-            return None
-
-        return VenueResponse.model_validate(inst, from_attributes=True)
+        return await _venue_response(venue_id)
 
     async def get_venue_for_owner(
         self, venue_id: UUID, owner_id: UUID
     ) -> VenueResponse | None:
-        try:
-            inst = await Venue.get(id=venue_id, owner_id=owner_id).prefetch_related(
-                "images", "unavailabilities"
-            )
-        except DoesNotExist:
-            return None
-        return VenueResponse.model_validate(inst, from_attributes=True)
+        return await _venue_response(venue_id, owner_id=owner_id)
 
     async def get_venues_by_ids(self, ids: list[UUID]) -> list[VenueListItem]:
-        venues = await Venue.filter(id__in=ids).prefetch_related("images")
-        results: list[VenueListItem] = []
-        for v in venues:
-            thumbnail = next(
-                (img.url for img in v.images if img.is_thumbnail),  # type: ignore[union-attr]
-                None,
-            )
-            results.append(
-                VenueListItem(
-                    id=v.id,
-                    name=v.name,
-                    city=v.city,
-                    sport_types=v.sport_types,
-                    status=VenueStatus(v.status),
-                    price_per_hour=v.price_per_hour,
-                    currency=v.currency,
-                    capacity=v.capacity,
-                    is_indoor=v.is_indoor,
-                    rating=v.rating,
-                    total_reviews=v.total_reviews,
-                    thumbnail=thumbnail,
-                )
-            )
-        return results
+        return await _list_items(Venue.filter(id__in=ids))
 
     async def list_venues(self, filters: VenueFilters) -> list[VenueListItem]:
         qs = Venue.all()
@@ -215,8 +267,9 @@ class VenueCRUD(CRUD[Venue, VenueResponse]):  # type: ignore
         if filters.city is not None:
             qs = qs.filter(city__icontains=filters.city)
         if filters.sport_type is not None:
-            # for SQLite use a raw .filter() override
-            target_value = json.dumps(filters.sport_type.value)
+            # jsonb containment (sport_types @> '["tennis"]') — served by the GIN
+            # index on Postgres. Tortoise has no JSON contains for SQLite.
+            target_value = json.dumps([filters.sport_type.value])
             qs = qs.filter(sport_types__contains=target_value)
         if filters.is_indoor is not None:
             qs = qs.filter(is_indoor=filters.is_indoor)
@@ -231,34 +284,17 @@ class VenueCRUD(CRUD[Venue, VenueResponse]):  # type: ignore
         if filters.owner_id is not None:
             qs = qs.filter(owner_id=filters.owner_id)
 
-        offset = (filters.page - 1) * filters.page_size
-        qs = qs.offset(offset).limit(filters.page_size)
-
-        venues = await qs.prefetch_related("images")
-
-        results: list[VenueListItem] = []
-        for v in venues:
-            thumbnail = next(
-                (img.url for img in v.images if img.is_thumbnail),  # type: ignore[union-attr]
-                None,
+        if filters.cursor is not None:
+            created_at, last_id = decode_cursor(filters.cursor)
+            qs = qs.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
             )
-            results.append(
-                VenueListItem(
-                    id=v.id,
-                    name=v.name,
-                    city=v.city,
-                    sport_types=v.sport_types,
-                    status=VenueStatus(v.status),
-                    price_per_hour=v.price_per_hour,
-                    currency=v.currency,
-                    capacity=v.capacity,
-                    is_indoor=v.is_indoor,
-                    rating=v.rating,
-                    total_reviews=v.total_reviews,
-                    thumbnail=thumbnail,
-                )
-            )
-        return results
+        else:
+            # Legacy offset paging — scans and discards every skipped row.
+            qs = qs.offset((filters.page - 1) * filters.page_size)
+        qs = qs.order_by("-created_at", "-id").limit(filters.page_size)
+
+        return await _list_items(qs)
 
 
 venue_crud = VenueCRUD(Venue, VenueResponse)
@@ -272,12 +308,15 @@ async def assert_owns_venue(venue_id: UUID, current_user: CurrentUser) -> None:
     """Admins bypass ownership; regular users must own the venue."""
     if VenueScope.ADMIN_WRITE in current_user.scopes:
         return
-    venue = await venue_crud.get_venue(venue_id)
-    if not venue:
+    # Only the owner column is needed — skip the full row and its prefetches.
+    owner_id = (
+        await Venue.filter(id=venue_id).first().values_list("owner_id", flat=True)
+    )
+    if owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Venue not found"
         )
-    if venue.owner_id != current_user.id:
+    if owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to modify this venue",
@@ -1,9 +1,8 @@
 from dataclasses import dataclass, field
-from functools import lru_cache
-from urllib.parse import quote, unquote
+from functools import cache, lru_cache
+from urllib.parse import unquote
 from uuid import UUID
 
-import httpx
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
@@ -21,23 +20,35 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class CurrentUser:
     id: UUID
     username: str
-    scopes: list[str] = field(default_factory=list)
+    scopes: frozenset[str] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of scopes, but keep membership checks O(1).
+        object.__setattr__(self, "scopes", frozenset(self.scopes))
 
     @property
     def is_admin(self) -> bool:
         return "admin:scopes" in self.scopes
 
 
-@lru_cache(maxsize=1)
-def _get_http_client() -> httpx.AsyncClient:
-    return httpx.AsyncClient(
-        base_url=settings.users_ms_url,
-        timeout=httpx.Timeout(5.0),
-    )
+@lru_cache(maxsize=4096)
+def _parse_identity(x_user_id: str, x_username: str, x_user_scopes: str) -> CurrentUser:
+    """Pure header → CurrentUser parse; repeat callers reuse the frozen result."""
+    try:
+        user_id = UUID(x_user_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid user identity from gateway",
+        ) from None
+
+    scopes = frozenset(x_user_scopes.split(" ")) if x_user_scopes else frozenset()
+
+    return CurrentUser(id=user_id, username=unquote(x_username), scopes=scopes)
 
 
 def get_current_user(
@@ -50,17 +61,7 @@ def get_current_user(
     The JWT has already been verified — we just trust these headers.
     NOTE: This only works behind Traefik. Run with that assumption.
     """
-    try:
-        user_id = UUID(x_user_id)
-    except (ValueError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid user identity from gateway",
-        ) from None
-
-    scopes = x_user_scopes.split(" ") if x_user_scopes else []
-
-    return CurrentUser(id=user_id, username=unquote(x_username), scopes=scopes)
+    return _parse_identity(x_user_id, x_username, x_user_scopes)
 
 
 def require_scopes(*required: str):
@@ -71,13 +72,24 @@ def require_scopes(*required: str):
         @router.get("/admin-only")
         async def admin_route(user = Depends(require_scopes("admin:scopes"))):
             ...
+
+    Equivalent scope sets return the same dependency object, so FastAPI's
+    per-request dependency cache resolves them once. Because that object is
+    keyed by the sorted scope set, the 403 detail lists missing scopes in
+    sorted order, not in the order they were passed here.
     """
+    return _require_scopes(tuple(sorted(frozenset(map(str, required)))))
+
+
+@cache
+def _require_scopes(required: tuple[str, ...]):
+    required_set = frozenset(required)
 
     async def _dep(
         current_user: CurrentUser = Depends(get_current_user),
     ) -> CurrentUser:
-        missing = [s for s in required if s not in current_user.scopes]
-        if missing:
+        if not required_set <= current_user.scopes:
+            missing = [s for s in required if s not in current_user.scopes]
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Missing required scopes: {', '.join(missing)}",
@@ -119,17 +131,12 @@ def _owner_or_admin(owner_scope: VenueScope, admin_scope: VenueScope):
       - the admin-level scope
     Raises 403 otherwise.
     """
+    accepted = frozenset((owner_scope, admin_scope, VenueScope.ADMIN))
 
     async def _dep(
         current_user: CurrentUser = Depends(get_current_user),
     ) -> CurrentUser:
-        has_owner = owner_scope in current_user.scopes
-        has_specific_admin = admin_scope in current_user.scopes
-        has_admin = VenueScope.ADMIN in current_user.scopes
-
-        if not (has_owner or has_specific_admin or has_admin):
-            from fastapi import HTTPException, status
-
+        if current_user.scopes.isdisjoint(accepted):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=(
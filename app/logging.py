@@ -7,16 +7,25 @@ from loguru import logger
 class _InterceptHandler(logging.Handler):
     """Route stdlib logging (uvicorn, fastapi, tortoise) through loguru."""
 
+    # Frames between a call site and emit() are fixed per call site, so walk
+    # them once and reuse the depth (uvicorn.access logs on every request).
+    # Unbounded, but bounded in practice by the number of distinct call sites.
+    _depth_cache: dict[tuple[str, str, int], int] = {}
+
     def emit(self, record: logging.LogRecord) -> None:
         try:
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno  # type: ignore[assignment]
 
-        frame, depth = sys._getframe(6), 6
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back  # type: ignore[assignment]
-            depth += 1
+        key = (record.name, record.pathname, record.lineno)
+        depth = self._depth_cache.get(key)
+        if depth is None:
+            frame, depth = sys._getframe(6), 6
+            while frame and frame.f_code.co_filename == logging.__file__:
+                frame = frame.f_back  # type: ignore[assignment]
+                depth += 1
+            self._depth_cache[key] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
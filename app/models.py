@@ -2,6 +2,8 @@ from enum import StrEnum
 
 from ms_core import AbstractModel as Model
 from tortoise import fields
+from tortoise.contrib.postgres.indexes import GinIndex
+from tortoise.indexes import PartialIndex
 
 
 class SportType(StrEnum):
@@ -22,12 +24,21 @@ class VenueStatus(StrEnum):
     PENDING_APPROVAL = "pending_approval"
 
 
+class PostgresGinIndex(GinIndex):
+    """GIN index emitted only on Postgres — SQLite (dev/tests) has no GIN."""
+
+    def get_sql(self, schema_generator, model, safe):  # type: ignore[override]
+        if schema_generator.DIALECT != "postgres":
+            return ""
+        return super().get_sql(schema_generator, model, safe)
+
+
 class Venue(Model):
     id = fields.UUIDField(primary_key=True)
 
     name = fields.CharField(max_length=255)
     description = fields.TextField()
-    sport_types = fields.JSONField(default=list)  # List[SportType]
+    sport_types = fields.JSONField(default=list)  # List[SportType]; jsonb on Postgres
     status = fields.CharEnumField(VenueStatus, default=VenueStatus.PENDING_APPROVAL)
 
     owner_id = fields.UUIDField()
@@ -73,6 +84,19 @@ class Venue(Model):
     class Meta:  # type: ignore
         table = "venues"
         ordering = ["-created_at"]
+        indexes = [
+            ("created_at", "id"),  # keyset pagination in list_venues
+            ("status", "created_at"),  # public listing: status filter + newest first
+            ("price_per_hour",),
+            # Public listing default: active venues filtered by price range.
+            PartialIndex(
+                fields=("price_per_hour",),
+                name="idx_venues_active_price",
+                condition={"status": VenueStatus.ACTIVE.value},
+            ),
+            ("capacity",),
+            PostgresGinIndex(fields=("sport_types",)),  # sport_types @> filter
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.city})"
@@ -0,0 +1,34 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust encoder instead of stdlib json.
+    Handles UUID, datetime and Decimal natively — no jsonable_encoder pass needed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def model_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Serialize an already-validated schema once and return it as-is.
+    Returning a Response makes FastAPI skip its response_model re-validation.
+    """
+    return Response(
+        model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -1,8 +1,15 @@
+import time
+
 from fastapi import APIRouter, Response
 from tortoise import Tortoise
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# Probes from every pod arrive every few seconds; a DB hit that succeeded
+# within this window is reused instead of driving another query.
+_READY_TTL_SECONDS = 5.0
+_last_ready_at: float | None = None
+
 
 @router.get("/live")
 async def liveness():
@@ -11,11 +18,17 @@ async def liveness():
 
 @router.get("/ready")
 async def readiness():
+    global _last_ready_at
+    now = time.monotonic()
+    if _last_ready_at is not None and now - _last_ready_at < _READY_TTL_SECONDS:
+        return {"status": "ok"}
     try:
         conn = Tortoise.get_connection("default")
         await conn.execute_query("SELECT 1")
+        _last_ready_at = now
         return {"status": "ok"}
     except Exception as exc:
+        _last_ready_at = None
         return Response(
             content=f'{{"status": "error", "detail": "{exc}"}}',
             status_code=503,
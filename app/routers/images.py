@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from app.crud import assert_owns_venue, venue_image_crud
 from app.deps import (
@@ -8,6 +8,7 @@ from app.deps import (
     can_images_or_admin,
 )
 from app.schemas import (
+    VENUE_IMAGE_LIST_ADAPTER,
     VenueImageCreate,
     VenueImageResponse,
     VenueImageUpdate,
@@ -17,8 +18,11 @@ router = APIRouter(prefix="/venues/{venue_id}/images", tags=["Venue Images"])
 
 
 @router.get("", response_model=list[VenueImageResponse])
-async def list_images(venue_id: UUID):
-    return await venue_image_crud.list_for_venue(venue_id)
+async def list_images(venue_id: UUID) -> Response:
+    images = await venue_image_crud.list_for_venue(venue_id)
+    return Response(
+        VENUE_IMAGE_LIST_ADAPTER.dump_json(images), media_type="application/json"
+    )
 
 
 @router.post(
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from app.crud import assert_owns_venue, venue_unavailability_crud
 from app.deps import (
@@ -8,6 +8,7 @@ from app.deps import (
     can_schedule_or_admin,
 )
 from app.schemas import (
+    VENUE_UNAVAILABILITY_LIST_ADAPTER,
     VenueUnavailabilityCreate,
     VenueUnavailabilityResponse,
     VenueUnavailabilityUpdate,
@@ -19,8 +20,12 @@ router = APIRouter(
 
 
 @router.get("", response_model=list[VenueUnavailabilityResponse])
-async def list_unavailabilities(venue_id: UUID):
-    return await venue_unavailability_crud.list_for_venue(venue_id)
+async def list_unavailabilities(venue_id: UUID) -> Response:
+    items = await venue_unavailability_crud.list_for_venue(venue_id)
+    return Response(
+        VENUE_UNAVAILABILITY_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.post(
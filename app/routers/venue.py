@@ -9,13 +9,16 @@ from app.deps import (
     can_delete_or_admin,
     can_write_or_admin,
 )
+from app.responses import model_response
 from app.schemas import (
+    VENUE_LIST_ADAPTER,
     VenueCreate,
     VenueFilters,
     VenueListItem,
     VenueResponse,
     VenueStatusUpdate,
     VenueUpdate,
+    encode_cursor,
 )
 from app.scopes import (
     VenueScope,
@@ -23,31 +26,49 @@ from app.scopes import (
 
 router = APIRouter(prefix="/venues", tags=["venues"])
 
+_NOT_FOUND = "Venue not found"
+_NOT_FOUND_OR_NOT_OWNED = "Venue not found or you don't own it"
+
+
+def _not_found(detail: str = _NOT_FOUND) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
 
 @router.get(
     "/",
+    response_model=list[VenueListItem],
     # dependencies=[Depends(can_read_venues)],
 )
-async def list_venues(
-    response: Response, filters: VenueFilters = Depends()
-) -> list[VenueListItem]:
-    response.headers["Cache-Control"] = "public, max-age=30, stale-while-revalidate=60"
-    return await venue_crud.list_venues(filters)
+async def list_venues(filters: VenueFilters = Depends()) -> Response:
+    venues = await venue_crud.list_venues(filters)
+    headers = {"Cache-Control": "public, max-age=30, stale-while-revalidate=60"}
+    # A full page means there may be more — hand back a keyset cursor.
+    if len(venues) == filters.page_size:
+        last = venues[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    # CRUD output is already validated — serialize once, skip FastAPI's re-check.
+    return Response(
+        VENUE_LIST_ADAPTER.dump_json(venues),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.post("/", response_model=VenueResponse, status_code=status.HTTP_201_CREATED)
 async def create_venue(
     payload: VenueCreate,
     current_user: CurrentUser = Depends(can_write_or_admin),
-):
-    return await venue_crud.create_venue(payload, owner_id=current_user.id)
+) -> Response:
+    venue = await venue_crud.create_venue(payload, owner_id=current_user.id)
+    return model_response(venue, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/bulk", response_model=list[VenueListItem])
 async def get_venues_bulk(
     ids: list[UUID] = Query(..., min_length=1),
-) -> list[VenueListItem]:
-    return await venue_crud.get_venues_by_ids(ids)
+) -> Response:
+    venues = await venue_crud.get_venues_by_ids(ids)
+    return Response(VENUE_LIST_ADAPTER.dump_json(venues), media_type="application/json")
 
 
 @router.get(
@@ -55,14 +76,14 @@ async def get_venues_bulk(
     response_model=VenueResponse,
     # dependencies=[Depends(can_read_venues)],
 )
-async def get_venue(venue_id: UUID, response: Response):
+async def get_venue(venue_id: UUID) -> Response:
     venue = await venue_crud.get_venue(venue_id)
     if not venue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Venue not found"
-        )
-    response.headers["Cache-Control"] = "public, max-age=60, stale-while-revalidate=120"
-    return venue
+        raise _not_found()
+    return model_response(
+        venue,
+        headers={"Cache-Control": "public, max-age=60, stale-while-revalidate=120"},
+    )
 
 
 @router.patch("/{venue_id}", response_model=VenueResponse)
@@ -70,27 +91,18 @@ async def update_venue(
     venue_id: UUID,
     payload: VenueUpdate,
     current_user: CurrentUser = Depends(can_write_or_admin),
-):
+) -> Response:
     if VenueScope.ADMIN_WRITE in current_user.scopes:
-        venue = await venue_crud.get_venue(venue_id)
+        venue = await venue_crud.admin_update_venue(venue_id, payload)
         if not venue:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Venue not found"
-            )
-        venue = await venue_crud.update_venue(
-            venue_id, payload, owner_id=venue.owner_id
-        )
+            raise _not_found()
     else:
         venue = await venue_crud.update_venue(
             venue_id, payload, owner_id=current_user.id
         )
-
-    if not venue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Venue not found or you don't own it",
-        )
-    return venue
+        if not venue:
+            raise _not_found(_NOT_FOUND_OR_NOT_OWNED)
+    return model_response(venue)
 
 
 @router.patch(
@@ -98,13 +110,11 @@ async def update_venue(
     response_model=VenueResponse,
     dependencies=[Depends(can_admin_write)],
 )
-async def update_venue_status(venue_id: UUID, payload: VenueStatusUpdate):
+async def update_venue_status(venue_id: UUID, payload: VenueStatusUpdate) -> Response:
     venue = await venue_crud.update_status(venue_id, payload)
     if not venue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Venue not found"
-        )
-    return venue
+        raise _not_found()
+    return model_response(venue)
 
 
 @router.delete("/{venue_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -118,7 +128,4 @@ async def delete_venue(
         deleted = await venue_crud.delete_venue(venue_id, owner_id=current_user.id)
 
     if not deleted:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Venue not found or you don't own it",
-        )
+        raise _not_found(_NOT_FOUND_OR_NOT_OWNED)
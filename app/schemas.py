@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import base64
 from datetime import datetime, time
 from decimal import Decimal
 from enum import StrEnum
+from functools import lru_cache
 from typing import Annotated, Any
 from uuid import UUID
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
     ConfigDict,
     Field,
+    TypeAdapter,
     field_serializer,
     field_validator,
     model_validator,
@@ -34,6 +38,12 @@ class VenueStatus(StrEnum):
     PENDING_APPROVAL = "pending_approval"
 
 
+@lru_cache(maxsize=1440)
+def _format_hhmm(t: time) -> str:
+    """HH:MM for a working-hours time; a day has only 1440, so cache them all."""
+    return t.strftime("%H:%M")
+
+
 class DayHours(BaseModel):
     """Opening and closing time for a single day."""
 
@@ -48,25 +58,53 @@ class DayHours(BaseModel):
 
     @field_serializer("open", "close")
     def serialize_time(self, t: time):
-        return t.strftime("%H:%M")
+        return _format_hhmm(t)
 
 
 WeeklyHours = dict[str, DayHours]
 
+_ALLOWED_DAY_KEYS: frozenset[str] = frozenset(
+    ("0", "1", "2", "3", "4", "5", "6", "default")
+)
+
 
 def _validate_working_hours(value: Any) -> WeeklyHours:
     """Coerce raw dict → WeeklyHours and validate day keys."""
     if not isinstance(value, dict):
         raise ValueError("working_hours must be a dict")
-    allowed_keys = {str(i) for i in range(7)} | {"default"}
     result: WeeklyHours = {}
     for k, v in value.items():
-        if k not in allowed_keys:
+        if k not in _ALLOWED_DAY_KEYS:
             raise ValueError(f"invalid day key '{k}'; must be '0'–'6' or 'default'")
         result[k] = DayHours.model_validate(v)
     return result
 
 
+def _to_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def encode_cursor(created_at: datetime, venue_id: UUID) -> str:
+    """Opaque keyset cursor for GET /venues — urlsafe base64 of `created_at|id`."""
+    raw = f"{created_at.isoformat()}|{venue_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of `encode_cursor`; raises ValueError on anything malformed."""
+    try:
+        created_at, venue_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(venue_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("invalid cursor") from None
+
+
+def _check_cursor(cursor: str | None) -> str | None:
+    if cursor is not None:
+        decode_cursor(cursor)
+    return cursor
+
+
 class VenueImageBase(BaseModel):
     url: str = Field(..., max_length=500)
     is_thumbnail: bool = False
@@ -146,8 +184,10 @@ class VenueBase(BaseModel):
     # Location
     address: str = Field(..., max_length=500)
     city: str = Field(..., max_length=100)
-    latitude: Decimal | None = Field(default=None, ge=-90, le=90, decimal_places=6)
-    longitude: Decimal | None = Field(default=None, ge=-180, le=180, decimal_places=6)
+    # Coordinates are plain floats — float64 is ample for 6 decimal places and
+    # serializes natively. Money (price_per_hour) stays Decimal.
+    latitude: float | None = Field(default=None, ge=-90, le=90)
+    longitude: float | None = Field(default=None, ge=-180, le=180)
 
     # Price
     price_per_hour: Decimal = Field(..., ge=0, decimal_places=2)
@@ -169,11 +209,11 @@ class VenueBase(BaseModel):
     @classmethod
     def deduplicate_sport_types(cls, v: Any) -> Any:
         if isinstance(v, list):
-            seen: list[Any] = []
-            for item in v:
-                if item not in seen:
-                    seen.append(item)
-            return seen
+            try:
+                # dict keys keep first-seen order — O(n) instead of list scans.
+                return list(dict.fromkeys(v))
+            except TypeError:
+                return v  # unhashable items — let field validation reject them
         return v
 
     @field_validator("currency", mode="before")
@@ -213,8 +253,8 @@ class VenueUpdate(BaseModel):
 
     address: str | None = Field(default=None, max_length=500)
     city: str | None = Field(default=None, max_length=100)
-    latitude: Decimal | None = Field(default=None, ge=-90, le=90)
-    longitude: Decimal | None = Field(default=None, ge=-180, le=180)
+    latitude: float | None = Field(default=None, ge=-90, le=90)
+    longitude: float | None = Field(default=None, ge=-180, le=180)
 
     price_per_hour: Decimal | None = Field(default=None, ge=0)
     currency: str | None = Field(default=None, min_length=3, max_length=3)
@@ -270,6 +310,41 @@ class VenueResponse(VenueBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_row(
+        cls,
+        row: dict[str, Any],
+        images: list[VenueImageResponse],
+        unavailabilities: list[VenueUnavailabilityResponse],
+    ) -> VenueResponse:
+        """
+        Build from a trusted DB row without running the validator tree.
+
+        Rows were validated by VenueCreate / VenueUpdate on the way in, so only
+        the values the DB hands back in raw form are coerced: the status and
+        sport type enums, Decimal coordinates, and working_hours stored as
+        {"open": "HH:MM", ...}.
+        Untrusted input must keep going through model_validate.
+        """
+        return cls.model_construct(
+            **{
+                **row,
+                "status": VenueStatus(row["status"]),
+                "sport_types": [SportType(s) for s in row["sport_types"]],
+                "latitude": _to_float(row["latitude"]),
+                "longitude": _to_float(row["longitude"]),
+                "working_hours": {
+                    day: DayHours.model_construct(
+                        open=time.fromisoformat(str(hours["open"])),
+                        close=time.fromisoformat(str(hours["close"])),
+                    )
+                    for day, hours in row["working_hours"].items()
+                },
+                "images": images,
+                "unavailabilities": unavailabilities,
+            }
+        )
+
 
 class VenueListItem(BaseModel):
     """
@@ -289,10 +364,17 @@ class VenueListItem(BaseModel):
     rating: Decimal
     total_reviews: int
     thumbnail: str | None = None  # first image with is_thumbnail=True if any
+    created_at: datetime  # keyset pagination anchor
 
     model_config = ConfigDict(from_attributes=True)
 
 
+# Batch validators for list endpoints — one schema dispatch per list, not per row.
+VENUE_LIST_ADAPTER = TypeAdapter(list[VenueListItem])
+VENUE_IMAGE_LIST_ADAPTER = TypeAdapter(list[VenueImageResponse])
+VENUE_UNAVAILABILITY_LIST_ADAPTER = TypeAdapter(list[VenueUnavailabilityResponse])
+
+
 class VenueFilters(BaseModel):
     """Bind to a FastAPI route via Depends(VenueFilters)."""
 
@@ -306,7 +388,12 @@ class VenueFilters(BaseModel):
     status: VenueStatus | None = None
     owner_id: UUID | None = None
 
-    # Pagination
+    # Pagination — `cursor` (from the X-Next-Cursor header) selects keyset
+    # paging; without it the legacy `page` offset is used. `page` is
+    # deprecated and kept only for existing clients.
+    # Validated as part of the annotation so FastAPI rejects a bad cursor as a
+    # query param (422) before Depends() constructs the model.
+    cursor: Annotated[str | None, AfterValidator(_check_cursor)] = None
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=100)
 
@@ -1,4 +1,46 @@
 import os
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
-db_url = os.environ.get("DB_URL", "sqlite://:memory:")
+# Tortoise turns extra DB URL query params into backend options; these are
+# filled in per scheme unless DB_URL already sets them.
+_POSTGRES_POOL = {
+    # Tortoise's own default is minsize=1, maxsize=5 — too small for a few
+    # concurrent list/detail requests that each fan out into several queries.
+    "minsize": os.environ.get("DB_POOL_MIN", "5"),
+    "maxsize": os.environ.get("DB_POOL_MAX", "20"),
+}
+# SQLite runs in WAL on one shared connection; extra params become PRAGMAs.
+_SQLITE_PRAGMAS = {
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": "-64000",
+    "mmap_size": "268435456",
+    "busy_timeout": "5000",
+}
+_URL_DEFAULTS = {
+    "postgres": _POSTGRES_POOL,
+    "asyncpg": _POSTGRES_POOL,
+    "psycopg": _POSTGRES_POOL,
+    "sqlite": _SQLITE_PRAGMAS,
+}
+
+
+def _with_url_defaults(url: str) -> str:
+    defaults = _URL_DEFAULTS.get(urlsplit(url).scheme)
+    if not defaults:
+        return url
+    # Rebuild only the query string — urlunsplit would turn `sqlite:///x` into
+    # `sqlite:/x` unless Tortoise has registered the scheme as netloc-bearing.
+    base, _, query = url.partition("?")
+    return f"{base}?{urlencode({**defaults, **dict(parse_qsl(query))})}"
+
+
+db_url = _with_url_defaults(os.environ.get("DB_URL", "sqlite://:memory:"))
 users_ms_url = os.environ.get("USERS_MS_URL", "http://localhost:8000")
+# Comma-separated; "*" (the default) keeps the permissive dev behaviour. Blank
+# entries are dropped, so a set-but-empty value allows no cross-origin requests.
+cors_allowed_origins = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
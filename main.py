@@ -6,18 +6,24 @@ from fastapi.middleware.cors import CORSMiddleware
 from ms_core import setup_app
 
 from app.logging import setup_logging
-from app.settings import db_url
+from app.responses import PydanticJSONResponse
+from app.settings import cors_allowed_origins, db_url
 
 setup_logging()
 
-application = FastAPI(title="ploshtadka-venue-ms", redirect_slashes=False)
+application = FastAPI(
+    title="ploshtadka-venue-ms",
+    redirect_slashes=False,
+    default_response_class=PydanticJSONResponse,
+)
 
 application.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=cors_allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 tortoise_conf = setup_app(application, db_url, Path("app") / "routers", ["app.models"])
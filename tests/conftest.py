@@ -5,11 +5,19 @@ No imports needed in test files — pytest discovers this by convention.
 
 from __future__ import annotations
 
+import inspect
+from functools import cache
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from app.crud import venue_crud, venue_image_crud, venue_unavailability_crud
 from app.deps import (
+    CurrentUser,
     can_admin_write,
     can_delete_or_admin,
     can_images_or_admin,
@@ -19,82 +27,208 @@ from app.deps import (
     can_write_or_admin,
     get_current_user,
 )
+from app.routers import images as images_router
+from app.routers import unavail as unavail_router
+from app.routers import venue as venue_router
 from app.routers.venue import router
+from app.scopes import VenueScope
 
-from .factories import make_admin, make_user
+from .factories import areturn, make_admin, make_user
 
 # ---------------------------------------------------------------------------
-# App builder — used by all client fixtures
+# Dependency overrides — used by all client fixtures
 # ---------------------------------------------------------------------------
 
 
-def build_app(current_user) -> FastAPI:
-    """
-    Fresh FastAPI app with every auth/scope dependency overridden to return
-    `current_user` unconditionally. Tests that need the *real* dep to run
-    (e.g. scope-rejection tests) should build their own app manually.
-    """
-    app = FastAPI()
-    app.include_router(router)
+_USER_DEPS = (
+    can_read_venues,
+    can_read_own_venues,
+    can_write_or_admin,
+    can_delete_or_admin,
+    can_images_or_admin,
+    can_schedule_or_admin,
+    can_admin_write,
+    get_current_user,
+)
+
+
+def _override_user(app: FastAPI, current_user) -> None:
+    """Point every auth/scope dependency on `app` at `current_user`."""
 
     async def _user():
         return current_user
 
-    for dep in (
-        can_read_venues,
-        can_read_own_venues,
-        can_write_or_admin,
-        can_delete_or_admin,
-        can_images_or_admin,
-        can_schedule_or_admin,
-        can_admin_write,
-        get_current_user,
-    ):
+    for dep in _USER_DEPS:
         app.dependency_overrides[dep] = _user
 
-    return app
-
 
 # ---------------------------------------------------------------------------
-# Reusable client fixtures
+# Reusable client fixtures — one app + TestClient per session; each test only
+# swaps the dependency overrides, which are cleared again on teardown.
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    app.include_router(images_router.router)
+    app.include_router(unavail_router.router)
+    return app
+
+
+@pytest.fixture(scope="session")
+def _client(_app) -> TestClient:
+    return TestClient(_app, raise_server_exceptions=True)
+
+
 @pytest.fixture()
-def owner_client():
+def client_factory(_app, _client):
+    """
+    Callable fixture: call it with any CurrentUser to get a scoped TestClient.
+    The client is shared — the latest call decides who is authenticated.
+
+    Usage in a test:
+        def test_something(client_factory):
+            client = client_factory(make_user(scopes=[VenueScope.READ]))
+            resp = client.get("/venues")
+    """
+
+    def _make(current_user) -> TestClient:
+        _override_user(_app, current_user)
+        return _client
+
+    yield _make
+    _app.dependency_overrides.clear()
+
+
+# Users per archetype — CurrentUser is frozen, so one instance per session.
+
+
+@pytest.fixture(scope="session")
+def _owner_user() -> CurrentUser:
+    return make_user()
+
+
+@pytest.fixture(scope="session")
+def _admin_user() -> CurrentUser:
+    return make_admin()
+
+
+@pytest.fixture(scope="session")
+def _reader_user() -> CurrentUser:
+    return make_user(scopes=[VenueScope.READ])
+
+
+@pytest.fixture()
+def owner_client(client_factory, _owner_user):
     """TestClient authenticated as a regular venue owner."""
-    return TestClient(build_app(make_user()), raise_server_exceptions=True)
+    return client_factory(_owner_user)
 
 
 @pytest.fixture()
-def admin_client():
+def admin_client(client_factory, _admin_user):
     """TestClient authenticated as an admin."""
-    return TestClient(build_app(make_admin()), raise_server_exceptions=True)
+    return client_factory(_admin_user)
+
+
+# Async clients — requests run on the test's own event loop via ASGITransport,
+# with no TestClient portal thread. Mark tests with @pytest.mark.anyio.
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture()
+async def owner_aclient(_app, _owner_user, client_factory):
+    """AsyncClient authenticated as a regular venue owner."""
+    client_factory(_owner_user)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=_app),
+        base_url="http://testserver",
+        follow_redirects=True,  # match TestClient
+    ) as client:
+        yield client
 
 
 @pytest.fixture()
-def anon_app():
+def anon_app(_app):
     """
-    Bare app with NO dependency overrides.
+    Shared app with NO dependency overrides.
     Use this when you want real scope/auth deps to run so you can assert 401/403.
+    Overrides a test installs are cleared on teardown.
     """
-    app = FastAPI()
-    app.include_router(router)
-    return app
+    _app.dependency_overrides.clear()
+    yield _app
+    _app.dependency_overrides.clear()
 
 
 @pytest.fixture()
-def client_factory():
+def reader_client(anon_app, _client, _reader_user):
+    """
+    TestClient authenticated as a read-only user. Only get_current_user is
+    overridden, so the real scope deps run — use it to assert 403s.
     """
-    Callable fixture: call it with any CurrentUser to get a scoped TestClient.
 
-    Usage in a test:
-        def test_something(client_factory):
-            client = client_factory(make_user(scopes=[VenueScope.READ]))
-            resp = client.get("/venues")
+    async def _user():
+        return _reader_user
+
+    anon_app.dependency_overrides[get_current_user] = _user
+    return _client
+
+
+# ---------------------------------------------------------------------------
+# CRUD mocks
+# ---------------------------------------------------------------------------
+
+
+@cache
+def _crud_methods(crud_type: type) -> tuple[str, ...]:
+    """Public coroutine method names on a CRUD class, introspected once."""
+    return tuple(
+        name
+        for name in dir(crud_type)
+        if not name.startswith("_")
+        and inspect.iscoroutinefunction(getattr(crud_type, name))
+    )
+
+
+def _crud_namespace(crud) -> SimpleNamespace:
+    return SimpleNamespace(**{name: AsyncMock() for name in _crud_methods(type(crud))})
+
+
+@pytest.fixture()
+def venue_crud_mock(monkeypatch) -> SimpleNamespace:
+    """
+    venue_crud stand-in installed on the venue router for one test: a plain
+    namespace with a fresh AsyncMock per CRUD method. Replace a method with
+    `areturn(value)` when the test doesn't inspect calls; otherwise set
+    `.return_value` on the AsyncMock. Unknown attributes raise AttributeError.
     """
+    mock = _crud_namespace(venue_crud)
+    monkeypatch.setattr(venue_router, "venue_crud", mock)
+    return mock
 
-    def _make(current_user) -> TestClient:
-        return TestClient(build_app(current_user), raise_server_exceptions=True)
 
-    return _make
+@pytest.fixture()
+def venue_image_crud_mock(monkeypatch) -> SimpleNamespace:
+    """Same as `venue_crud_mock`, for venue_image_crud on the images router."""
+    mock = _crud_namespace(venue_image_crud)
+    monkeypatch.setattr(images_router, "venue_image_crud", mock)
+    return mock
+
+
+@pytest.fixture()
+def venue_unavailability_crud_mock(monkeypatch) -> SimpleNamespace:
+    """Same as `venue_crud_mock`, for venue_unavailability_crud."""
+    mock = _crud_namespace(venue_unavailability_crud)
+    monkeypatch.setattr(unavail_router, "venue_unavailability_crud", mock)
+    return mock
+
+
+@pytest.fixture()
+def owns_venue(monkeypatch) -> None:
+    """Let the images router's ownership check pass without a DB lookup."""
+    monkeypatch.setattr(images_router, "assert_owns_venue", areturn(None))
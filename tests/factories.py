@@ -6,27 +6,47 @@ Import from here in every test file — never define dummy data inline.
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from app.deps import CurrentUser
+from app.schemas import (
+    VenueImageResponse,
+    VenueListItem,
+    VenueResponse,
+    VenueUnavailabilityResponse,
+)
 from app.scopes import VenueScope
 
 # ---------------------------------------------------------------------------
-# Stable IDs — use these when a specific, repeatable UUID is needed.
+# Stable IDs — fixed sentinels, identical across runs; use these when a
+# specific, repeatable UUID is needed.
 # Call uuid4() inline when you need a fresh one per test.
 # ---------------------------------------------------------------------------
 
-OWNER_ID: UUID = uuid4()
-OTHER_USER_ID: UUID = uuid4()
-ADMIN_ID: UUID = uuid4()
+OWNER_ID: UUID = UUID("00000000-0000-0000-0000-000000000001")
+OTHER_USER_ID: UUID = UUID("00000000-0000-0000-0000-000000000002")
+ADMIN_ID: UUID = UUID("00000000-0000-0000-0000-000000000003")
 
-VENUE_ID: UUID = uuid4()
-IMAGE_ID: UUID = uuid4()
-UNAVAIL_ID: UUID = uuid4()
+VENUE_ID: UUID = UUID("00000000-0000-0000-0000-000000000004")
+IMAGE_ID: UUID = UUID("00000000-0000-0000-0000-000000000005")
+UNAVAIL_ID: UUID = UUID("00000000-0000-0000-0000-000000000006")
 
 NOW = datetime(2026, 6, 1, 10, 0, 0, tzinfo=UTC)
 LATER = NOW + timedelta(hours=3)
 
+# ---------------------------------------------------------------------------
+# Route URLs for the stable IDs above
+# ---------------------------------------------------------------------------
+
+URL_VENUES = "/venues"
+URL_VENUES_BULK = "/venues/bulk"
+URL_VENUE = f"/venues/{VENUE_ID}"
+URL_VENUE_STATUS = f"{URL_VENUE}/status"
+URL_VENUE_IMAGES = f"{URL_VENUE}/images"
+URL_VENUE_IMAGE = f"{URL_VENUE_IMAGES}/{IMAGE_ID}"
+URL_VENUE_REORDER = f"{URL_VENUE_IMAGES}/reorder"
+URL_VENUE_UNAVAILABILITIES = f"{URL_VENUE}/unavailabilities"
+
 
 # ---------------------------------------------------------------------------
 # User factories
@@ -110,6 +130,7 @@ def venue_list_item(**overrides) -> dict:
         rating="4.50",
         total_reviews=10,
         thumbnail=None,
+        created_at=NOW.isoformat(),
     )
     return {**base, **overrides}
 
@@ -192,3 +213,31 @@ def unavail_create_payload(**overrides) -> dict:
         reason="Maintenance",
     )
     return {**base, **overrides}
+
+
+# ---------------------------------------------------------------------------
+# Async stubs
+# ---------------------------------------------------------------------------
+
+
+def areturn(value):
+    """
+    Bare coroutine function returning `value` — a cheap stand-in for
+    `AsyncMock(return_value=value)` when the test doesn't inspect calls.
+    """
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+# ---------------------------------------------------------------------------
+# Prebuilt schema instances — validated once at import. Routes only serialize
+# them, so tests can share these; derive variants with `.model_copy(update=...)`.
+# ---------------------------------------------------------------------------
+
+VENUE_RESPONSE = VenueResponse(**venue_response())
+VENUE_LIST_ITEM = VenueListItem(**venue_list_item())
+IMAGE_RESPONSE = VenueImageResponse(**image_response())
+UNAVAIL_RESPONSE = VenueUnavailabilityResponse(**unavail_response())
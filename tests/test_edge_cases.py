@@ -0,0 +1,19 @@
+import json
+from decimal import Decimal
+
+from app.responses import PydanticJSONResponse
+
+from .factories import NOW, VENUE_ID
+
+
+class TestPydanticJSONResponse:
+    def test_renders_uuid_decimal_datetime(self):
+        resp = PydanticJSONResponse(
+            {"id": VENUE_ID, "price_per_hour": Decimal("20.00"), "updated_at": NOW}
+        )
+        assert resp.media_type == "application/json"
+        assert json.loads(resp.body) == {
+            "id": str(VENUE_ID),
+            "price_per_hour": "20.00",
+            "updated_at": "2026-06-01T10:00:00Z",
+        }
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.routers import health
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> SimpleNamespace:
+    """Controllable monotonic clock for the readiness TTL; set `.now`."""
+    fake = SimpleNamespace(now=0.0)
+    fake.monotonic = lambda: fake.now
+    monkeypatch.setattr(health, "time", fake)
+    monkeypatch.setattr(health, "_last_ready_at", None)
+    return fake
+
+
+@pytest.fixture()
+def db(monkeypatch) -> AsyncMock:
+    """The readiness probe's `SELECT 1`; set `.side_effect` to fail it."""
+    execute_query = AsyncMock()
+    conn = SimpleNamespace(execute_query=execute_query)
+    monkeypatch.setattr(health.Tortoise, "get_connection", lambda name: conn)
+    return execute_query
+
+
+def _ok(resp) -> bool:
+    return resp == {"status": "ok"}
+
+
+class TestReadiness:
+    async def test_success_cached_within_ttl(self, clock, db):
+        assert _ok(await health.readiness())
+        clock.now = health._READY_TTL_SECONDS - 0.1
+        assert _ok(await health.readiness())
+        assert db.await_count == 1
+
+    async def test_cache_expires_after_ttl(self, clock, db):
+        assert _ok(await health.readiness())
+        clock.now = health._READY_TTL_SECONDS
+        assert _ok(await health.readiness())
+        assert db.await_count == 2
+
+    async def test_failure_never_cached(self, clock, db):
+        db.side_effect = ConnectionError("db down")
+        assert (await health.readiness()).status_code == 503
+        clock.now = 1.0
+        assert (await health.readiness()).status_code == 503
+        db.side_effect = None
+        clock.now = 2.0
+        assert _ok(await health.readiness())
+        assert db.await_count == 3
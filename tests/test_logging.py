@@ -0,0 +1,60 @@
+import logging
+
+import pytest
+from loguru import logger
+
+from app.logging import _InterceptHandler
+
+
+@pytest.fixture()
+def intercepted(monkeypatch):
+    """
+    Stdlib logger routed through _InterceptHandler, with a fresh depth cache.
+    Yields (logger, records) — records collects what loguru receives.
+    """
+    monkeypatch.setattr(_InterceptHandler, "_depth_cache", {})
+    records = []
+    sink_id = logger.add(records.append, level=0, format="{message}")
+    log = logging.getLogger("tests.intercept")
+    log.handlers = [_InterceptHandler()]
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    yield log, records
+    logger.remove(sink_id)
+    log.handlers = []
+
+
+def _log_from_one_site(log: logging.Logger) -> None:
+    log.info("hello")
+
+
+class TestInterceptHandlerDepth:
+    def test_same_call_site_reuses_walked_depth(self, intercepted, monkeypatch):
+        log, records = intercepted
+        _log_from_one_site(log)  # walks the frames
+        _log_from_one_site(log)  # served from the cache
+        (cached,) = _InterceptHandler._depth_cache.values()
+
+        # A fresh walk from the same site must land on the same depth.
+        monkeypatch.setattr(_InterceptHandler, "_depth_cache", {})
+        _log_from_one_site(log)
+        (walked,) = _InterceptHandler._depth_cache.values()
+        assert cached == walked
+
+        # ...and every record is attributed to the caller, not to logging.
+        sites = {(m.record["file"].path, m.record["function"]) for m in records}
+        assert sites == {(__file__, "_log_from_one_site")}
+        assert len(records) == 3
+
+    def test_exception_call_site_keyed_separately(self, intercepted):
+        log, records = intercepted
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.error("plain")
+            log.exception("with traceback")
+
+        plain, exc = (message.record for message in records)
+        assert len(_InterceptHandler._depth_cache) == 2
+        expected = "test_exception_call_site_keyed_separately"
+        assert plain["function"] == exc["function"] == expected
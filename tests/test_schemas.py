@@ -7,132 +7,107 @@ from app.schemas import (
     SportType,
     VenueCreate,
     VenueFilters,
+    VenueResponse,
     VenueUnavailabilityCreate,
+    decode_cursor,
+    encode_cursor,
 )
 
-from .factories import LATER, NOW
+from .factories import LATER, NOW, VENUE_ID, venue_create_payload, venue_response
 
 
 class TestVenueCreateSchema:
     def test_valid_payload(self):
-        data = VenueCreate(
-            name="Tennis Club",
-            description="A wonderful tennis club in the city centre.",
-            address="1 Sports Ave",
-            city="Sofia",
-            price_per_hour=Decimal("25.00"),
-            sport_types=[SportType.TENNIS],
+        data = VenueCreate.model_validate(
+            venue_create_payload(sport_types=[SportType.TENNIS])
         )
         assert data.currency == "EUR"
         assert data.capacity == 1
 
     def test_currency_uppercased(self):
-        data = VenueCreate(
-            name="Club",
-            description="Long enough description here.",
-            address="Addr",
-            city="City",
-            price_per_hour=Decimal("10"),
-            currency="eur",
-        )
+        data = VenueCreate.model_validate(venue_create_payload(currency="eur"))
         assert data.currency == "EUR"
 
     def test_sport_types_deduplicated(self):
-        data = VenueCreate(
-            name="Multi-sport",
-            description="Long enough description here.",
-            address="Addr",
-            city="City",
-            price_per_hour=Decimal("10"),
-            sport_types=[SportType.FOOTBALL, SportType.FOOTBALL, SportType.GYM],
+        data = VenueCreate.model_validate(
+            venue_create_payload(
+                sport_types=[SportType.FOOTBALL, SportType.FOOTBALL, SportType.GYM]
+            )
         )
         assert data.sport_types == [SportType.FOOTBALL, SportType.GYM]
 
-    def test_name_too_short_raises(self):
-        with pytest.raises(ValidationError):
-            VenueCreate(
-                name="X",
-                description="Fine description.",
-                address="Addr",
-                city="City",
-                price_per_hour=Decimal("10"),
-            )
-
-    def test_negative_price_raises(self):
-        with pytest.raises(ValidationError):
-            VenueCreate(
-                name="Club",
-                description="Fine description.",
-                address="Addr",
-                city="City",
-                price_per_hour=Decimal("-5"),
-            )
-
-    def test_capacity_zero_raises(self):
-        with pytest.raises(ValidationError):
-            VenueCreate(
-                name="Club",
-                description="Fine description.",
-                address="Addr",
-                city="City",
-                price_per_hour=Decimal("10"),
-                capacity=0,
-            )
+    def test_coordinates_serialized_as_numbers(self):
+        data = VenueCreate.model_validate(
+            venue_create_payload(latitude="42.697708", longitude=23.321868)
+        )
+        dumped = data.model_dump(mode="json")
+        assert dumped["latitude"] == 42.697708
+        assert dumped["longitude"] == 23.321868
+
+    @pytest.mark.parametrize(
+        ("override", "match"),
+        [
+            ({"name": "X"}, None),
+            ({"price_per_hour": Decimal("-5")}, None),
+            ({"capacity": 0}, None),
+            (
+                {"working_hours": {"8": {"open": "08:00", "close": "22:00"}}},
+                "invalid day key",
+            ),
+            ({"working_hours": {"0": {"open": "22:00", "close": "08:00"}}}, None),
+        ],
+        ids=[
+            "name-too-short",
+            "negative-price",
+            "capacity-zero",
+            "invalid-day-key",
+            "close-before-open",
+        ],
+    )
+    def test_invalid_payload_raises(self, override, match):
+        with pytest.raises(ValidationError, match=match):
+            VenueCreate.model_validate(venue_create_payload(**override))
 
 
 class TestWorkingHoursSchema:
     def test_valid_working_hours(self):
-        data = VenueCreate(
-            name="Morning Club",
-            description="Opens early every day of the week.",
-            address="Addr",
-            city="City",
-            price_per_hour=Decimal("10"),
-            working_hours={
-                "default": {"open": "08:00", "close": "22:00"},
-                "6": {"open": "10:00", "close": "18:00"},
-            },
+        data = VenueCreate.model_validate(
+            venue_create_payload(
+                working_hours={
+                    "default": {"open": "08:00", "close": "22:00"},
+                    "6": {"open": "10:00", "close": "18:00"},
+                }
+            )
         )
         assert "default" in data.working_hours
         assert "6" in data.working_hours
 
-    def test_invalid_day_key_raises(self):
-        with pytest.raises(Exception, match="invalid day key"):
-            VenueCreate(
-                name="Morning Club",
-                description="Opens early every day of the week.",
-                address="Addr",
-                city="City",
-                price_per_hour=Decimal("10"),
-                working_hours={"8": {"open": "08:00", "close": "22:00"}},
-            )
-
-    def test_close_before_open_raises(self):
-        with pytest.raises(ValidationError):
-            VenueCreate(
-                name="Morning Club",
-                description="Opens early every day of the week.",
-                address="Addr",
-                city="City",
-                price_per_hour=Decimal("10"),
-                working_hours={"0": {"open": "22:00", "close": "08:00"}},
-            )
-
 
 class TestVenueFiltersSchema:
     def test_price_range_inversion_raises(self):
         with pytest.raises(Exception, match="min_price"):
-            VenueFilters(min_price=Decimal("100"), max_price=Decimal("10"))
+            VenueFilters.model_validate(
+                {"min_price": Decimal("100"), "max_price": Decimal("10")}
+            )
 
     def test_defaults(self):
-        f = VenueFilters()
+        f = VenueFilters.model_validate({})
         assert f.page == 1
         assert f.page_size == 20
         assert f.status is None
 
     def test_page_size_capped(self):
         with pytest.raises(ValidationError):
-            VenueFilters(page_size=999)
+            VenueFilters.model_validate({"page_size": 999})
+
+    def test_cursor_round_trip(self):
+        cursor = encode_cursor(NOW, VENUE_ID)
+        assert VenueFilters.model_validate({"cursor": cursor}).cursor == cursor
+        assert decode_cursor(cursor) == (NOW, VENUE_ID)
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(ValidationError, match="invalid cursor"):
+            VenueFilters.model_validate({"cursor": "not-a-cursor"})
 
 
 class TestUnavailabilitySchema:
@@ -150,3 +125,18 @@ class TestUnavailabilitySchema:
             reason="Holiday",
         )
         assert obj.reason == "Holiday"
+
+
+class TestVenueResponseFromRow:
+    def test_matches_validated_output(self):
+        data = venue_response(
+            working_hours={"0": {"open": "08:00", "close": "22:00"}},
+        )
+        validated = VenueResponse.model_validate(data)
+        row = validated.model_dump(exclude={"images", "unavailabilities"})
+        row["status"] = str(row["status"])
+        row["sport_types"] = [str(s) for s in row["sport_types"]]
+
+        built = VenueResponse.from_row(row, images=[], unavailabilities=[])
+
+        assert built.model_dump_json() == validated.model_dump_json()
@@ -1,6 +1,10 @@
+import pytest
+from fastapi import HTTPException
+
+from app.deps import can_admin_write, get_current_user, require_scopes
 from app.scopes import VenueScope
 
-from .factories import make_admin, make_user
+from .factories import OWNER_ID, make_admin, make_user
 
 
 class TestCurrentUserScopes:
@@ -15,3 +19,50 @@ class TestCurrentUserScopes:
     def test_scoped_user_missing_admin_scope(self):
         user = make_user(scopes=[VenueScope.READ, VenueScope.WRITE])
         assert VenueScope.ADMIN_WRITE not in user.scopes
+
+    def test_scopes_stored_as_frozenset(self):
+        user = make_user(scopes=[VenueScope.READ, VenueScope.READ])
+        assert user.scopes == frozenset({VenueScope.READ})
+
+    def test_header_scopes_parsed_into_frozenset(self):
+        user = get_current_user(
+            x_user_id=str(OWNER_ID),
+            x_username="owner",
+            x_user_scopes=f"{VenueScope.READ} {VenueScope.WRITE}",
+        )
+        assert user.scopes == frozenset({VenueScope.READ, VenueScope.WRITE})
+
+    def test_repeated_headers_reuse_parsed_identity(self):
+        headers = dict(
+            x_user_id=str(OWNER_ID),
+            x_username="owner",
+            x_user_scopes=str(VenueScope.READ),
+        )
+        assert get_current_user(**headers) is get_current_user(**headers)
+
+
+class TestRequireScopes:
+    def test_argument_order_shares_dependency(self):
+        assert require_scopes(VenueScope.READ, VenueScope.ME) is require_scopes(
+            VenueScope.ME, VenueScope.READ
+        )
+
+    def test_equivalent_scope_sets_share_dependency(self):
+        assert require_scopes(VenueScope.READ, VenueScope.ME) is require_scopes(
+            "venues:me", "venues:read"
+        )
+
+    def test_module_level_dependency_is_reused(self):
+        assert can_admin_write is require_scopes(
+            VenueScope.ADMIN_WRITE, VenueScope.ADMIN_READ, VenueScope.ADMIN
+        )
+
+    @pytest.mark.anyio
+    async def test_missing_scopes_listed_in_sorted_order(self):
+        dep = require_scopes(VenueScope.WRITE, VenueScope.ME)
+        with pytest.raises(HTTPException) as exc_info:
+            await dep(current_user=make_user(scopes=[]))
+        assert exc_info.value.status_code == 403
+        assert (
+            exc_info.value.detail == "Missing required scopes: venues:me, venues:write"
+        )
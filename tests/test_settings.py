@@ -0,0 +1,136 @@
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from app import settings
+from app.settings import _SQLITE_PRAGMAS, _with_url_defaults
+
+
+def _query(url: str) -> dict[str, str]:
+    return {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+
+
+@pytest.fixture()
+def reload_settings(monkeypatch):
+    """
+    Re-import app.settings under a patched environment; `None` unsets a var.
+    The module is reloaded with the real environment again on teardown.
+    """
+
+    def _reload(**env: str | None):
+        for name, value in env.items():
+            if value is None:
+                monkeypatch.delenv(name, raising=False)
+            else:
+                monkeypatch.setenv(name, value)
+        return importlib.reload(settings)
+
+    yield _reload
+    monkeypatch.undo()
+    importlib.reload(settings)
+
+
+class TestUrlDefaults:
+    @pytest.mark.parametrize(
+        "url",
+        ["sqlite://:memory:", "sqlite:///data/db.sqlite3"],
+        ids=["memory", "file"],
+    )
+    def test_sqlite_gets_pragmas(self, url):
+        result = _with_url_defaults(url)
+        assert result.startswith(url + "?")
+        assert _query(result) == _SQLITE_PRAGMAS
+
+    def test_user_supplied_param_wins(self):
+        result = _with_url_defaults("sqlite://:memory:?synchronous=FULL")
+        assert _query(result) == {**_SQLITE_PRAGMAS, "synchronous": "FULL"}
+
+    def test_user_supplied_extra_param_kept(self):
+        result = _with_url_defaults("sqlite://:memory:?journal_mode=DELETE")
+        assert _query(result)["journal_mode"] == "DELETE"
+
+    @pytest.mark.parametrize(
+        "url",
+        ["sqlite:///data/db.sqlite3", "sqlite:///data/db.sqlite3?synchronous=FULL"],
+        ids=["plain", "with-query"],
+    )
+    def test_base_url_untouched_in_fresh_interpreter(self, url):
+        """Without Tortoise imported first, only the query string may change."""
+        script = (
+            "import sys\n"
+            "from app.settings import db_url\n"
+            "assert 'tortoise' not in sys.modules\n"
+            "print(db_url)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[1],
+            env={**os.environ, "DB_URL": url},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip().startswith(url.partition("?")[0] + "?")
+
+    @pytest.mark.parametrize(
+        "url",
+        ["mysql://user:pw@db:3306/venues", "mssql://db/venues"],
+        ids=["mysql", "mssql"],
+    )
+    def test_other_schemes_untouched(self, url):
+        assert _with_url_defaults(url) == url
+
+
+class TestPostgresPool:
+    URL = "postgres://user:pw@db:5432/venues"
+
+    @pytest.mark.parametrize("scheme", ["postgres", "asyncpg", "psycopg"])
+    def test_defaults_applied(self, reload_settings, scheme):
+        mod = reload_settings(DB_POOL_MIN=None, DB_POOL_MAX=None)
+        url = self.URL.replace("postgres", scheme, 1)
+        assert _query(mod._with_url_defaults(url)) == {
+            "minsize": "5",
+            "maxsize": "20",
+        }
+
+    def test_sized_from_env(self, reload_settings):
+        mod = reload_settings(DB_POOL_MIN="2", DB_POOL_MAX="50")
+        assert _query(mod._with_url_defaults(self.URL)) == {
+            "minsize": "2",
+            "maxsize": "50",
+        }
+
+    def test_url_params_win_over_env(self, reload_settings):
+        mod = reload_settings(DB_POOL_MIN="2", DB_POOL_MAX="50")
+        result = mod._with_url_defaults(self.URL + "?maxsize=8")
+        assert _query(result) == {"minsize": "2", "maxsize": "8"}
+
+    def test_db_url_env_gets_pool(self, reload_settings):
+        mod = reload_settings(DB_URL=self.URL, DB_POOL_MIN=None, DB_POOL_MAX=None)
+        assert _query(mod.db_url) == {"minsize": "5", "maxsize": "20"}
+
+
+class TestCorsAllowedOrigins:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (None, ["*"]),
+            ("https://a.example", ["https://a.example"]),
+            (
+                " https://a.example , https://b.example ",
+                ["https://a.example", "https://b.example"],
+            ),
+            ("https://a.example,,", ["https://a.example"]),
+            ("", []),
+            (" , ", []),
+        ],
+        ids=["unset", "single", "comma-separated", "trailing-commas", "empty", "blank"],
+    )
+    def test_parsing(self, reload_settings, raw, expected):
+        mod = reload_settings(CORS_ALLOWED_ORIGINS=raw)
+        assert mod.cors_allowed_origins == expected
@@ -0,0 +1,27 @@
+from .factories import (
+    UNAVAIL_RESPONSE,
+    URL_VENUE_UNAVAILABILITIES,
+    areturn,
+    unavail_response,
+)
+
+
+class TestListUnavailabilities:
+    def test_returns_json_list(self, owner_client, venue_unavailability_crud_mock):
+        venue_unavailability_crud_mock.list_for_venue = areturn([UNAVAIL_RESPONSE])
+        resp = owner_client.get(URL_VENUE_UNAVAILABILITIES)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == [
+            {
+                **unavail_response(),
+                "start_datetime": "2026-06-01T10:00:00Z",
+                "end_datetime": "2026-06-01T13:00:00Z",
+            }
+        ]
+
+    def test_empty_list(self, owner_client, venue_unavailability_crud_mock):
+        venue_unavailability_crud_mock.list_for_venue = areturn([])
+        resp = owner_client.get(URL_VENUE_UNAVAILABILITIES)
+        assert resp.status_code == 200
+        assert resp.json() == []
@@ -1,60 +1,96 @@
-from unittest.mock import AsyncMock, patch
+import pytest
 
-from fastapi.testclient import TestClient
-
-from app.schemas import VenueResponse
-from app.scopes import VenueScope
+from app.schemas import VenueStatus, encode_cursor
 
 from .factories import (
+    NOW,
     OWNER_ID,
+    URL_VENUE,
+    URL_VENUE_STATUS,
+    URL_VENUES,
+    URL_VENUES_BULK,
     VENUE_ID,
-    make_admin,
-    make_user,
-    venue_list_item,
-    venue_response,
+    VENUE_LIST_ITEM,
+    VENUE_RESPONSE,
+    areturn,
 )
 
 
+@pytest.mark.anyio
 class TestListVenues:
-    def test_returns_200(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.list_venues = AsyncMock(return_value=[venue_list_item()])
-            resp = client_factory(make_user()).get("/venues")
+    async def test_returns_200(self, owner_aclient, venue_crud_mock):
+        venue_crud_mock.list_venues = areturn([VENUE_LIST_ITEM])
+        resp = await owner_aclient.get(URL_VENUES)
         assert resp.status_code == 200
-        assert isinstance(resp.json(), list)
+        assert [v["id"] for v in resp.json()] == [str(VENUE_ID)]
 
-    def test_empty_list(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.list_venues = AsyncMock(return_value=[])
-            resp = client_factory(make_user()).get("/venues")
+    async def test_empty_list(self, owner_aclient, venue_crud_mock):
+        venue_crud_mock.list_venues = areturn([])
+        resp = await owner_aclient.get(URL_VENUES)
         assert resp.status_code == 200
         assert resp.json() == []
 
-    def test_filters_forwarded(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.list_venues = AsyncMock(return_value=[])
-            resp = client_factory(make_user()).get(
-                "/venues", params={"city": "Sofia", "is_indoor": True, "page": 2}
-            )
+    async def test_filters_forwarded(self, owner_aclient, venue_crud_mock):
+        venue_crud_mock.list_venues.return_value = []
+        resp = await owner_aclient.get(
+            URL_VENUES, params={"city": "Sofia", "is_indoor": True, "page": 2}
+        )
         assert resp.status_code == 200
-        call_filters = mock_crud.list_venues.call_args[0][0]
+        call_filters = venue_crud_mock.list_venues.call_args[0][0]
         assert call_filters.city == "Sofia"
         assert call_filters.is_indoor is True
         assert call_filters.page == 2
 
+    async def test_full_page_sets_next_cursor(self, owner_aclient, venue_crud_mock):
+        venue_crud_mock.list_venues = areturn([VENUE_LIST_ITEM])
+        resp = await owner_aclient.get(URL_VENUES, params={"page_size": 1})
+        assert resp.status_code == 200
+        assert resp.headers["X-Next-Cursor"] == encode_cursor(NOW, VENUE_ID)
+
+    async def test_partial_page_has_no_cursor(self, owner_aclient, venue_crud_mock):
+        venue_crud_mock.list_venues = areturn([VENUE_LIST_ITEM])
+        resp = await owner_aclient.get(URL_VENUES)
+        assert resp.status_code == 200
+        assert "X-Next-Cursor" not in resp.headers
+
+    async def test_cursor_forwarded(self, owner_aclient, venue_crud_mock):
+        cursor = encode_cursor(NOW, VENUE_ID)
+        venue_crud_mock.list_venues.return_value = []
+        resp = await owner_aclient.get(URL_VENUES, params={"cursor": cursor})
+        assert resp.status_code == 200
+        assert venue_crud_mock.list_venues.call_args[0][0].cursor == cursor
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", ""], ids=["garbage", "empty"])
+    async def test_invalid_cursor_returns_422(
+        self, owner_aclient, venue_crud_mock, cursor
+    ):
+        resp = await owner_aclient.get(URL_VENUES, params={"cursor": cursor})
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["loc"] == ["query", "cursor"]
+        venue_crud_mock.list_venues.assert_not_awaited()
+
+
+class TestGetVenuesBulk:
+    def test_returns_json_list(self, owner_client, venue_crud_mock):
+        venue_crud_mock.get_venues_by_ids.return_value = [VENUE_LIST_ITEM]
+        resp = owner_client.get(URL_VENUES_BULK, params={"ids": [str(VENUE_ID)]})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert [v["id"] for v in resp.json()] == [str(VENUE_ID)]
+        venue_crud_mock.get_venues_by_ids.assert_awaited_once_with([VENUE_ID])
+
 
 class TestGetVenue:
-    def test_existing_venue_returns_200(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.get_venue = AsyncMock(return_value=venue_response())
-            resp = client_factory(make_user()).get(f"/venues/{VENUE_ID}")
+    def test_existing_venue_returns_200(self, owner_client, venue_crud_mock):
+        venue_crud_mock.get_venue = areturn(VENUE_RESPONSE)
+        resp = owner_client.get(URL_VENUE)
         assert resp.status_code == 200
         assert resp.json()["id"] == str(VENUE_ID)
+        assert resp.headers["cache-control"].startswith("public, max-age=60")
 
-    def test_missing_venue_returns_404(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.get_venue = AsyncMock(return_value=None)
-            resp = client_factory(make_user()).get(f"/venues/{VENUE_ID}")
+    def test_missing_venue_returns_404(self, owner_client, venue_crud_mock):
+        venue_crud_mock.get_venue = areturn(None)
+        resp = owner_client.get(URL_VENUE)
         assert resp.status_code == 404
         assert resp.json()["detail"] == "Venue not found"
 
@@ -69,143 +105,105 @@ class TestCreateVenue:
         "sport_types": ["tennis"],
     }
 
-    def test_owner_can_create(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.create_venue = AsyncMock(return_value=venue_response())
-            resp = client_factory(make_user()).post("/venues", json=self.PAYLOAD)
+    def test_owner_can_create(self, owner_client, venue_crud_mock):
+        venue_crud_mock.create_venue.return_value = VENUE_RESPONSE
+        resp = owner_client.post(URL_VENUES, json=self.PAYLOAD)
         assert resp.status_code == 201
-        mock_crud.create_venue.assert_awaited_once()
+        venue_crud_mock.create_venue.assert_awaited_once()
 
-    def test_owner_id_injected_from_auth(self, client_factory):
+    def test_owner_id_injected_from_auth(self, owner_client, venue_crud_mock):
         """owner_id must come from the token, not the request body."""
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.create_venue = AsyncMock(return_value=venue_response())
-            client_factory(make_user(user_id=OWNER_ID)).post(
-                "/venues", json=self.PAYLOAD
-            )
-        _, kwargs = mock_crud.create_venue.call_args
+        venue_crud_mock.create_venue.return_value = VENUE_RESPONSE
+        owner_client.post(URL_VENUES, json=self.PAYLOAD)
+        _, kwargs = venue_crud_mock.create_venue.call_args
         assert kwargs["owner_id"] == OWNER_ID
 
-    def test_invalid_payload_returns_422(self, client_factory):
-        resp = client_factory(make_user()).post("/venues", json={"name": "X"})
+    def test_invalid_payload_returns_422(self, owner_client):
+        resp = owner_client.post(URL_VENUES, json={"name": "X"})
         assert resp.status_code == 422
 
-    def test_user_without_write_scope_gets_403(self, anon_app):
-        from app.deps import get_current_user
-
-        async def _non_admin_user():
-            return make_user(scopes=[VenueScope.READ])
-
-        anon_app.dependency_overrides[get_current_user] = _non_admin_user
-        with TestClient(anon_app) as c:
-            resp = c.post("/venues", json=self.PAYLOAD)
-
+    def test_user_without_write_scope_gets_403(self, reader_client):
+        resp = reader_client.post(URL_VENUES, json=self.PAYLOAD)
         assert resp.status_code == 403
 
 
 class TestUpdateVenue:
     PATCH = {"name": "Renamed Court"}
 
-    def test_owner_can_update_own_venue(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.update_venue = AsyncMock(
-                return_value=venue_response(name="Renamed Court")
-            )
-            resp = client_factory(make_user()).patch(
-                f"/venues/{VENUE_ID}", json=self.PATCH
-            )
+    def test_owner_can_update_own_venue(self, owner_client, venue_crud_mock):
+        venue_crud_mock.update_venue = areturn(
+            VENUE_RESPONSE.model_copy(update={"name": "Renamed Court"})
+        )
+        resp = owner_client.patch(URL_VENUE, json=self.PATCH)
         assert resp.status_code == 200
         assert resp.json()["name"] == "Renamed Court"
 
-    def test_returns_404_when_not_owner(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.update_venue = AsyncMock(return_value=None)
-            resp = client_factory(make_user()).patch(
-                f"/venues/{VENUE_ID}", json=self.PATCH
-            )
-        assert resp.status_code == 404
-
-    def test_admin_bypasses_ownership(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            existing = VenueResponse(**venue_response())
-            mock_crud.get_venue = AsyncMock(return_value=existing)
-            mock_crud.update_venue = AsyncMock(
-                return_value=venue_response(name="Admin Edit")
-            )
-            resp = client_factory(make_admin()).patch(
-                f"/venues/{VENUE_ID}", json=self.PATCH
-            )
+    def test_admin_bypasses_ownership(self, admin_client, venue_crud_mock):
+        venue_crud_mock.admin_update_venue.return_value = VENUE_RESPONSE.model_copy(
+            update={"name": "Admin Edit"}
+        )
+        resp = admin_client.patch(URL_VENUE, json=self.PATCH)
         assert resp.status_code == 200
-        # Admin path calls get_venue first to resolve owner_id
-        mock_crud.get_venue.assert_awaited_once_with(VENUE_ID)
-
-    def test_admin_404_when_venue_missing(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.get_venue = AsyncMock(return_value=None)
-            resp = client_factory(make_admin()).patch(
-                f"/venues/{VENUE_ID}", json=self.PATCH
-            )
-        assert resp.status_code == 404
+        assert resp.json()["name"] == "Admin Edit"
+        # Admin path updates by id alone — no owner lookup first
+        venue_crud_mock.admin_update_venue.assert_awaited_once()
+        assert venue_crud_mock.admin_update_venue.call_args[0][0] == VENUE_ID
+        venue_crud_mock.get_venue.assert_not_called()
+        venue_crud_mock.update_venue.assert_not_called()
 
 
 class TestUpdateVenueStatus:
-    def test_admin_can_change_status(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.update_status = AsyncMock(
-                return_value=venue_response(status="inactive")
-            )
-            resp = client_factory(make_admin()).patch(
-                f"/venues/{VENUE_ID}/status", json={"status": "inactive"}
-            )
+    def test_admin_can_change_status(self, admin_client, venue_crud_mock):
+        venue_crud_mock.update_status = areturn(
+            VENUE_RESPONSE.model_copy(update={"status": VenueStatus.INACTIVE})
+        )
+        resp = admin_client.patch(URL_VENUE_STATUS, json={"status": "inactive"})
         assert resp.status_code == 200
         assert resp.json()["status"] == "inactive"
 
-    def test_invalid_status_returns_422(self, client_factory):
-        resp = client_factory(make_admin()).patch(
-            f"/venues/{VENUE_ID}/status", json={"status": "flying"}
-        )
+    def test_invalid_status_returns_422(self, admin_client):
+        resp = admin_client.patch(URL_VENUE_STATUS, json={"status": "flying"})
         assert resp.status_code == 422
 
-    def test_non_admin_gets_403(self, anon_app):
+    def test_non_admin_gets_403(self, reader_client):
         """Non-admin users should be rejected before the route handler runs."""
-        from app.deps import get_current_user
-
-        async def _non_admin_user():
-            return make_user(scopes=[VenueScope.READ])
-
-        anon_app.dependency_overrides[get_current_user] = _non_admin_user
-
-        with TestClient(anon_app) as client:
-            resp = client.patch(
-                f"/venues/{VENUE_ID}/status", json={"status": "inactive"}
-            )
-
+        resp = reader_client.patch(URL_VENUE_STATUS, json={"status": "inactive"})
         assert resp.status_code == 403
 
 
 class TestDeleteVenue:
-    def test_owner_deletes_own_venue(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.delete_venue = AsyncMock(return_value=True)
-            resp = client_factory(make_user()).delete(f"/venues/{VENUE_ID}")
-        assert resp.status_code == 204
-
-    def test_owner_404_when_not_found(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.delete_venue = AsyncMock(return_value=False)
-            resp = client_factory(make_user()).delete(f"/venues/{VENUE_ID}")
-        assert resp.status_code == 404
-
-    def test_admin_uses_admin_delete(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.admin_delete_venue = AsyncMock(return_value=True)
-            resp = client_factory(make_admin()).delete(f"/venues/{VENUE_ID}")
+    def test_admin_uses_admin_delete(self, admin_client, venue_crud_mock):
+        venue_crud_mock.admin_delete_venue.return_value = True
+        resp = admin_client.delete(URL_VENUE)
         assert resp.status_code == 204
-        mock_crud.admin_delete_venue.assert_awaited_once_with(VENUE_ID)
-        mock_crud.delete_venue.assert_not_called()
-
-    def test_admin_404_when_not_found(self, client_factory):
-        with patch("app.routers.venue.venue_crud") as mock_crud:
-            mock_crud.admin_delete_venue = AsyncMock(return_value=False)
-            resp = client_factory(make_admin()).delete(f"/venues/{VENUE_ID}")
-        assert resp.status_code == 404
+        venue_crud_mock.admin_delete_venue.assert_awaited_once_with(VENUE_ID)
+        venue_crud_mock.delete_venue.assert_not_called()
+
+
+class TestOwnerAdminOutcomes:
+    """CRUD result → status code for the owner/admin update and delete paths."""
+
+    @pytest.mark.parametrize(
+        ("client", "method", "crud_attr", "retval", "expected"),
+        [
+            ("owner_client", "patch", "update_venue", None, 404),
+            ("admin_client", "patch", "admin_update_venue", None, 404),
+            ("owner_client", "delete", "delete_venue", True, 204),
+            ("owner_client", "delete", "delete_venue", False, 404),
+            ("admin_client", "delete", "admin_delete_venue", False, 404),
+        ],
+        ids=[
+            "owner-update-missing",
+            "admin-update-missing",
+            "owner-delete-ok",
+            "owner-delete-missing",
+            "admin-delete-missing",
+        ],
+    )
+    def test_status_code(
+        self, request, venue_crud_mock, client, method, crud_attr, retval, expected
+    ):
+        setattr(venue_crud_mock, crud_attr, areturn(retval))
+        kwargs = {"json": TestUpdateVenue.PATCH} if method == "patch" else {}
+        resp = request.getfixturevalue(client).request(method, URL_VENUE, **kwargs)
+        assert resp.status_code == expected